@@ -4,16 +4,27 @@ from typing import List, Annotated
 from settings import Config
 from src.llm_models import LLMModel, HFModel
 from src.vectorstore import VectorStoreManager
+from src.web_search import WebSearchManager
 from src.components import get_retrieval_grader_prompt, get_router_prompt, get_rag_prompt, format_docs, doc_grader_instructions, doc_grader_prompt, get_retrieval_grader_prompt, answer_grader_instructions, answer_grader_prompt, hallucination_grader_instructions, hallucination_grader_prompt
 from langchain.schema import Document
 from langgraph.graph import END
 from langchain_core.messages import SystemMessage, HumanMessage
 import json
-from langchain_community.tools.tavily_search import TavilySearchResults
+from functools import lru_cache
 from langgraph.graph import StateGraph, graph
 from IPython.display import Image, display
 
-web_search_tool = TavilySearchResults(k=3)
+Config.initialize()
+web_search_tool = WebSearchManager()
+
+
+@lru_cache(maxsize=None)
+def get_vector_store():
+    """Builds the vector store on first use so its retrieval cache is shared across graph runs."""
+    vector_store = VectorStoreManager()
+    vector_store.ingest_documents()
+    return vector_store
+
 
 class GraphState(TypedDict):
     """
@@ -45,7 +56,7 @@ def retrieve(state):
     question = state["question"]
 
     # Write retrieved documents to documents key in state
-    documents = VectorStoreManager.retrieve_documents.invoke(question)
+    documents = get_vector_store().retrieve_documents(question)
     return {"documents": documents}
 
 
@@ -135,7 +146,7 @@ def web_search(state):
     documents = state.get("documents", [])
 
     # Web search
-    docs = web_search_tool.invoke({"query": question})
+    docs = web_search_tool.search(question)
     web_results = "\n".join([d["content"] for d in docs])
     web_results = Document(page_content=web_results)
     documents.append(web_results)
@@ -8,8 +8,21 @@ class Config:
     DATA_FOLDER = "data"
     EMBEDDING_MODEL_PATH = "models/sentence_transformer"
     GENERATION_MODEL_PATH = "models/generation_model"
+    EMBEDDING_MODEL_NAME = EMBEDDING_MODEL_PATH
+    GENERATION_MODEL_NAME = GENERATION_MODEL_PATH
     FAISS_INDEX_PATH = "vectorstore/faiss_index.bin"
     CROSS_VALIDATION_SPLITS = 5
+    RETRIEVAL_CACHE_SIZE = 256
+    WEB_SEARCH_BACKEND = os.environ.get("WEB_SEARCH_BACKEND", "tavily")  # "tavily" or "local"
+    # Local backend corpus: a JSON list of {"url": ..., "content": ...} objects
+    WEB_SEARCH_CORPUS_PATH = "data/web_search/corpus.json"
+    WEB_SEARCH_MAX_RESULTS = 3
+    WEB_SEARCH_CACHE_TTL = 3600  # seconds
+    WEB_SEARCH_CACHE_SIZE = 512
+    WEB_SEARCH_TIMEOUT = 10  # seconds
+    WEB_SEARCH_POOL_SIZE = 4  # HTTP connections kept open to the search API
+    WEB_SEARCH_WORKERS = 8  # threads running backend calls under the timeout budget
+
     @staticmethod
     def set_env(var: str):
         """Prompts for environment variables if they are not already set."""
@@ -20,7 +33,8 @@ class Config:
     @staticmethod
     def initialize():
         """Sets all required environment variables."""
-        Config.set_env("TAVILY_API_KEY")
+        if Config.WEB_SEARCH_BACKEND == "tavily":
+            Config.set_env("TAVILY_API_KEY")
         Config.set_env("LANGCHAIN_API_KEY")
         os.environ["TOKENIZERS_PARALLELISM"] = "true"
         os.environ["LANGCHAIN_TRACING_V2"] = "true"
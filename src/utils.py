@@ -0,0 +1,7 @@
+# src/utils.py
+import re
+
+
+def normalize_query(query):
+    """Lowercases and collapses whitespace so equivalent queries share a cache entry."""
+    return re.sub(r"\s+", " ", query).strip().lower()
@@ -1,35 +1,118 @@
 # backend/vectorstore/vectorstore_manager.py
 import os
+import threading
+from collections import OrderedDict
 import faiss
 import numpy as np
-from llm_models import HFModel, LLMModel
-from file_handler import parse_pdf_with_pypdf
+from src.llm_models import HFModel, LLMModel
+from src.file_handler import parse_pdf_with_pypdf
+from src.utils import normalize_query
 from settings import Config
 
+
+class LRUCache:
+    """Bounded mapping that evicts the least recently used entry and counts hits and misses."""
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        # Shared across Streamlit sessions, which run on separate threads
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            if key in self.data:
+                self.data.move_to_end(key)
+                self.hits += 1
+                return self.data[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        with self.lock:
+            self.data[key] = value
+            self.data.move_to_end(key)
+            if len(self.data) > self.max_size:
+                self.data.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.data.clear()
+
+    def stats(self):
+        with self.lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self.data), "max_size": self.max_size}
+
+
 class VectorStoreManager:
-    def __init__(self):
-        self.model = HFModel(Config.EMBEDDING_MODEL_NAME, Config.GENERATION_MODEL_NAME)
+    def __init__(self, model=None, cache_size=Config.RETRIEVAL_CACHE_SIZE):
+        self.model = model or HFModel(Config.EMBEDDING_MODEL_NAME, Config.GENERATION_MODEL_NAME)
         self.embeddings = []
         self.metadata = []
         self.index = None
+        # Bumped on every index rebuild so cached results from an older index are never served
+        self.index_version = 0
+        self.embedding_cache = LRUCache(cache_size)
+        self.result_cache = LRUCache(cache_size)
 
     def ingest_documents(self, data_folder=Config.DATA_FOLDER):
+        documents = []
         for filename in os.listdir(data_folder):
             if filename.endswith(".pdf"):
                 pdf_path = os.path.join(data_folder, filename)
-                documents = parse_pdf_with_pypdf(pdf_path)
-                for doc in documents:
-                    embedding = self.model.embed_text(doc.page_content)
-                    self.embeddings.append(embedding)
-                    self.metadata.append(doc.page_content)
+                documents.extend(parse_pdf_with_pypdf(pdf_path))
+        self.add_documents(documents)
+
+    def add_documents(self, documents):
+        for doc in documents:
+            embedding = self.model.embed_text(doc.page_content)
+            self.embeddings.append(embedding)
+            self.metadata.append(doc)
         self.build_faiss_index()
 
     def build_faiss_index(self):
-        embeddings_array = np.array(self.embeddings).astype("float32")
-        self.index = faiss.IndexFlatL2(embeddings_array.shape[1])
-        self.index.add(embeddings_array)
+        if self.embeddings:
+            embeddings_array = np.array(self.embeddings).astype("float32")
+            self.index = faiss.IndexFlatL2(embeddings_array.shape[1])
+            self.index.add(embeddings_array)
+        else:
+            print("---NO DOCUMENTS TO INDEX---")
+            self.index = None
+        self.index_version += 1
+        self.result_cache.clear()
+
+    def embed_query(self, query):
+        # The normalized text is what gets embedded, so casing and spacing never affect retrieval
+        # and every query sharing a cache key also shares the same embedding
+        key = normalize_query(query)
+        embedding = self.embedding_cache.get(key)
+        if embedding is None:
+            embedding = self.model.embed_text(key)
+            self.embedding_cache.put(key, embedding)
+        return embedding
 
     def retrieve_documents(self, query, top_k=5):
-        query_embedding = self.model.embed_text(query)
-        distances, indices = self.index.search(np.array([query_embedding]), top_k)
-        return [self.metadata[idx] for idx in indices[0]]
+        key = (normalize_query(query), top_k, self.index_version)
+        results = self.result_cache.get(key)
+        if results is not None:
+            return list(results)
+
+        if self.index is None:
+            return []
+
+        query_embedding = self.embed_query(query)
+        distances, indices = self.index.search(np.array([query_embedding]).astype("float32"), top_k)
+        # FAISS pads with -1 when the index holds fewer than top_k vectors
+        results = [self.metadata[idx] for idx in indices[0] if idx >= 0]
+        self.result_cache.put(key, results)
+        return list(results)
+
+    def cache_stats(self):
+        """Returns hit/miss statistics for the embedding and retrieval caches."""
+        return {
+            "index_version": self.index_version,
+            "embeddings": self.embedding_cache.stats(),
+            "results": self.result_cache.stats(),
+        }
@@ -0,0 +1,161 @@
+# src/web_search.py
+import os
+import json
+import re
+import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+import requests
+from requests.adapters import HTTPAdapter
+from settings import Config
+from src.utils import normalize_query
+
+
+def tokenize(text):
+    """Splits text into lowercase word tokens, ignoring punctuation."""
+    return re.findall(r"\w+", text.lower())
+
+
+class TavilyBackend:
+    """Calls the Tavily search API over a pooled HTTP session."""
+
+    API_URL = "https://api.tavily.com/search"
+
+    def __init__(self, api_key=None, pool_size=Config.WEB_SEARCH_POOL_SIZE):
+        self.api_key = api_key or os.environ.get("TAVILY_API_KEY")
+        if not self.api_key:
+            raise ValueError("TAVILY_API_KEY is not set. Run Config.initialize() or use the local backend.")
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+
+    def search(self, query, max_results, timeout):
+        response = self.session.post(
+            self.API_URL,
+            json={"api_key": self.api_key, "query": query, "max_results": max_results},
+            timeout=timeout,
+        )
+        response.raise_for_status()
+        results = response.json().get("results", [])
+        return [{"url": r.get("url", ""), "content": r.get("content", "")} for r in results]
+
+    def close(self):
+        self.session.close()
+
+
+class LocalJSONBackend:
+    """Offline backend that ranks entries of a local JSON corpus by term overlap.
+
+    The corpus is a list of objects with "url" and "content" keys, which lets the
+    web search fallback be exercised without network access.
+    """
+
+    def __init__(self, corpus_path=Config.WEB_SEARCH_CORPUS_PATH):
+        if not os.path.isfile(corpus_path):
+            raise FileNotFoundError(
+                f"Web search corpus not found at '{corpus_path}'. Set Config.WEB_SEARCH_CORPUS_PATH "
+                "to a JSON list of {\"url\", \"content\"} objects to use the local backend."
+            )
+        with open(corpus_path, encoding="utf-8") as f:
+            self.corpus = json.load(f)
+        self.terms = [set(tokenize(entry["content"])) for entry in self.corpus]
+
+    def search(self, query, max_results, timeout):
+        query_terms = set(tokenize(query))
+        scored = []
+        for entry, terms in zip(self.corpus, self.terms):
+            score = len(query_terms & terms)
+            if score:
+                scored.append((score, entry))
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return [{"url": entry.get("url", ""), "content": entry["content"]} for _, entry in scored[:max_results]]
+
+    def close(self):
+        pass
+
+
+class WebSearchManager:
+    """Web search with a bounded TTL cache keyed on the normalized query and a per-call timeout.
+
+    Backend calls run on a thread pool so the timeout holds even for backends that ignore it.
+    Concurrent misses for the same query share one backend call. On timeout a queued call is
+    cancelled; a call that is already running keeps its worker until the backend returns, and
+    its late result is still stored in the cache for the next identical query.
+    """
+
+    BACKENDS = {
+        "tavily": TavilyBackend,
+        "local": LocalJSONBackend,
+    }
+
+    def __init__(self, backend=None, max_results=Config.WEB_SEARCH_MAX_RESULTS,
+                 cache_ttl=Config.WEB_SEARCH_CACHE_TTL, cache_size=Config.WEB_SEARCH_CACHE_SIZE,
+                 timeout=Config.WEB_SEARCH_TIMEOUT, workers=Config.WEB_SEARCH_WORKERS):
+        if backend is None:
+            backend = Config.WEB_SEARCH_BACKEND
+        if isinstance(backend, str):
+            backend = self.BACKENDS[backend]()
+        self.backend = backend
+        self.max_results = max_results
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self.timeout = timeout
+        self.cache = OrderedDict()
+        self.in_flight = {}
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+
+    def search(self, query):
+        """Returns a list of {"url", "content"} results, or an empty list on timeout or error."""
+        key = normalize_query(query)
+        now = time.monotonic()
+        with self.lock:
+            cached = self.cache.get(key)
+            if cached:
+                if cached[0] > now:
+                    self.cache.move_to_end(key)
+                    return list(cached[1])
+                del self.cache[key]
+
+            future = self.in_flight.get(key)
+            started = future is None
+            if started:
+                future = self.executor.submit(self.backend.search, query, self.max_results, self.timeout)
+                self.in_flight[key] = future
+
+        # Registered outside the lock since it runs immediately if the call already finished
+        if started:
+            future.add_done_callback(lambda f: self._store_result(key, f))
+
+        # Enforce the time budget even if the backend ignores its timeout argument
+        try:
+            results = future.result(timeout=self.timeout)
+        except TimeoutError:
+            future.cancel()
+            print(f"---WEB SEARCH TIMED OUT AFTER {self.timeout}s---")
+            return []
+        except Exception as e:
+            print(f"---WEB SEARCH FAILED: {e}---")
+            return []
+        return list(results)
+
+    def _store_result(self, key, future):
+        """Caches a finished backend call, including one that completed after its caller timed out."""
+        with self.lock:
+            if self.in_flight.get(key) is future:
+                del self.in_flight[key]
+            if future.cancelled() or future.exception() is not None:
+                return
+            self.cache[key] = (time.monotonic() + self.cache_ttl, future.result())
+            self.cache.move_to_end(key)
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+
+    def clear_cache(self):
+        with self.lock:
+            self.cache.clear()
+
+    def close(self):
+        self.executor.shutdown(wait=False)
+        self.backend.close()
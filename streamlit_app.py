@@ -11,8 +11,14 @@ Config.initialize()
 # Load the LLM model
 llm = HFModel()
 
-# Vector store setup
-vector_manager = VectorStoreManager("data/ersattningsmodell_vaders_2019.pdf")
+# Vector store setup, kept across reruns so its retrieval cache survives each interaction
+@st.cache_resource
+def get_vector_manager():
+    manager = VectorStoreManager()
+    manager.ingest_documents()
+    return manager
+
+vector_manager = get_vector_manager()
 
 # Streamlit UI
 st.title("Local RAG Chatbot")
@@ -29,7 +35,7 @@ if st.button("Submit"):
         
         if route_decision['datasource'] == 'vectorstore':
             # Retrieve relevant documents
-            docs = vector_manager.load_documents("backend/data/ersattningsmodell_vaders_2019.pdf")
+            docs = vector_manager.retrieve_documents(question)
             context = format_docs(docs)
 
             # Generate RAG response
@@ -0,0 +1,61 @@
+import numpy as np
+from langchain_core.documents import Document
+from src.vectorstore import LRUCache, VectorStoreManager
+
+
+class StubEmbeddingModel:
+    """Embeds text as letter counts so nearest neighbours are predictable."""
+
+    def __init__(self):
+        self.calls = []
+
+    def embed_text(self, text):
+        self.calls.append(text)
+        return np.array([text.count(c) for c in "abc"], dtype="float32")
+
+
+def make_manager(cache_size=8):
+    manager = VectorStoreManager(model=StubEmbeddingModel(), cache_size=cache_size)
+    manager.add_documents([Document(page_content="aaa"), Document(page_content="bbb")])
+    return manager
+
+
+def test_repeated_normalized_query_hits_cache():
+    manager = make_manager()
+    first = manager.retrieve_documents("AA", top_k=1)
+    second = manager.retrieve_documents("  aa ", top_k=1)
+    assert first == second
+    assert first[0].page_content == "aaa"
+    stats = manager.cache_stats()
+    assert stats["results"]["hits"] == 1
+    assert stats["results"]["misses"] == 1
+    assert manager.model.calls.count("aa") == 1
+
+
+def test_rebuilding_index_invalidates_results():
+    manager = make_manager()
+    assert manager.retrieve_documents("c", top_k=1)[0].page_content == "aaa"
+    version = manager.index_version
+
+    manager.add_documents([Document(page_content="ccc")])
+    assert manager.index_version == version + 1
+    assert manager.retrieve_documents("c", top_k=1)[0].page_content == "ccc"
+    assert manager.cache_stats()["results"]["misses"] == 2
+
+
+def test_empty_corpus_builds_no_index():
+    manager = VectorStoreManager(model=StubEmbeddingModel())
+    manager.build_faiss_index()
+    assert manager.index is None
+    assert manager.retrieve_documents("a") == []
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.stats() == {"hits": 2, "misses": 1, "size": 2, "max_size": 2}
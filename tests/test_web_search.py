@@ -0,0 +1,80 @@
+import time
+import pytest
+from settings import Config
+from src.web_search import LocalJSONBackend, WebSearchManager, TavilyBackend
+
+
+class CountingBackend:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = []
+
+    def search(self, query, max_results, timeout):
+        self.calls.append(query)
+        time.sleep(self.delay)
+        return [{"url": query, "content": f"result for {query}"}]
+
+    def close(self):
+        pass
+
+
+def test_local_backend_ranks_shipped_corpus():
+    backend = LocalJSONBackend(Config.WEB_SEARCH_CORPUS_PATH)
+    results = backend.search("Does road salt work in winter?", max_results=2, timeout=1)
+    assert results[0]["url"].endswith("road-salt")
+    assert len(results) <= 2
+
+
+def test_local_backend_ignores_punctuation():
+    backend = LocalJSONBackend(Config.WEB_SEARCH_CORPUS_PATH)
+    assert backend.search("snödrev", max_results=3, timeout=1)
+
+
+def test_local_backend_missing_corpus(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        LocalJSONBackend(str(tmp_path / "missing.json"))
+
+
+def test_tavily_backend_requires_api_key(monkeypatch):
+    monkeypatch.delenv("TAVILY_API_KEY", raising=False)
+    with pytest.raises(ValueError):
+        TavilyBackend()
+
+
+def test_cache_hit_on_normalized_query_returns_copy():
+    backend = CountingBackend()
+    manager = WebSearchManager(backend)
+    first = manager.search("Road  Salt")
+    first.append("mutated")
+    second = manager.search("road salt")
+    assert backend.calls == ["Road  Salt"]
+    assert "mutated" not in second
+
+
+def test_cache_entries_expire_after_ttl():
+    backend = CountingBackend()
+    manager = WebSearchManager(backend, cache_ttl=0.05)
+    manager.search("snow")
+    time.sleep(0.1)
+    manager.search("snow")
+    assert backend.calls == ["snow", "snow"]
+
+
+def test_cache_is_bounded():
+    manager = WebSearchManager(CountingBackend(), cache_size=2)
+    for query in ("a", "b", "c"):
+        manager.search(query)
+    assert list(manager.cache) == ["b", "c"]
+
+
+def test_timeout_cancels_queued_calls_and_caches_late_result():
+    backend = CountingBackend(delay=0.3)
+    manager = WebSearchManager(backend, timeout=0.1, workers=1)
+    assert manager.search("q0") == []
+    assert manager.search("q1") == []
+    time.sleep(0.4)
+
+    # q1 was still queued when it timed out, so it never reached the backend
+    assert backend.calls == ["q0"]
+    assert manager.search("q0") == [{"url": "q0", "content": "result for q0"}]
+    assert backend.calls == ["q0"]